@@ -0,0 +1,17 @@
+from dataclasses import dataclass, field
+from strawberry.dataloader import DataLoader
+from strawberry.django.context import StrawberryDjangoContext
+
+from apps.recipes.models import Recipe, RecipeIngredient
+from .loaders import grouped_loader, model_loader
+
+
+@dataclass
+class GraphQLContext(StrawberryDjangoContext):
+    recipe_loader: DataLoader = field(default_factory=lambda: model_loader(Recipe))
+    recipe_ingredients_loader: DataLoader = field(
+        default_factory=lambda: grouped_loader(
+            RecipeIngredient.objects.select_related("ingredient").order_by("id"),
+            "recipe_id",
+        )
+    )
@@ -0,0 +1,57 @@
+from typing import Iterator
+
+from graphql import FieldNode, OperationDefinitionNode, OperationType
+from strawberry.extensions import SchemaExtension
+
+
+def is_introspection(document) -> bool:
+    """True when every operation in the document only selects __ fields"""
+    operations = [
+        definition
+        for definition in document.definitions
+        if isinstance(definition, OperationDefinitionNode)
+    ]
+    return bool(operations) and all(
+        operation.operation == OperationType.QUERY
+        and all(
+            isinstance(selection, FieldNode) and selection.name.value.startswith("__")
+            for selection in operation.selection_set.selections
+        )
+        for operation in operations
+    )
+
+
+class IntrospectionCache(SchemaExtension):
+    """
+    Serve repeated introspection queries from memory. Their result only
+    depends on the schema, which can't change while the process runs
+    """
+
+    def __init__(self, maxsize: int = 32) -> None:
+        self.maxsize = maxsize
+        self.results = {}
+
+    def on_execute(self) -> Iterator[None]:
+        # Keep a local reference: the extension instance is shared by
+        # concurrent requests
+        execution_context = self.execution_context
+        document = execution_context.graphql_document
+
+        if (
+            document is None
+            or execution_context.variables
+            or not is_introspection(document)
+        ):
+            yield
+            return
+
+        key = (execution_context.query, execution_context.operation_name)
+        if key in self.results:
+            execution_context.result = self.results[key]
+            yield
+            return
+
+        yield
+        result = execution_context.result
+        if result is not None and not result.errors and len(self.results) < self.maxsize:
+            self.results[key] = result
@@ -0,0 +1,37 @@
+from asgiref.sync import sync_to_async
+from strawberry.dataloader import DataLoader
+
+
+def model_loader(model) -> DataLoader:
+    """
+    Per-request DataLoader of model instances keyed by primary key. Keys
+    requested in the same tick are fetched together in a single IN query;
+    a missing key raises the model's DoesNotExist, like .get(pk=...)
+    """
+
+    async def load(keys):
+        found = await sync_to_async(model.objects.in_bulk)(keys)
+        return [
+            found.get(key)
+            or model.DoesNotExist(
+                f"{model._meta.object_name} matching query does not exist."
+            )
+            for key in keys
+        ]
+
+    return DataLoader(load_fn=load)
+
+
+def grouped_loader(queryset, key_field: str) -> DataLoader:
+    """
+    Per-request DataLoader of the rows in queryset whose key_field equals
+    each key. All keys requested in the same tick share one IN query
+    """
+
+    async def load(keys):
+        groups = {key: [] for key in keys}
+        async for row in queryset.filter(**{f"{key_field}__in": keys}):
+            groups[getattr(row, key_field)].append(row)
+        return [groups[key] for key in keys]
+
+    return DataLoader(load_fn=load)
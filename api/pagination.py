@@ -0,0 +1,31 @@
+import base64
+import json
+
+
+def encode_cursor(*values) -> str:
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> list:
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError:
+        raise ValueError("Invalid cursor.")
+
+
+async def fetch_rows(queryset) -> list:
+    # Callers pass page-bounded slices, so one plain query beats a server-side
+    # cursor's DECLARE/FETCH/CLOSE round trips
+    return [row async for row in queryset]
+
+
+async def keyset_page(queryset, page_size: int, cursor_key):
+    """
+    Fetch one row past page_size to know whether another page exists,
+    without running a COUNT over the whole table
+    """
+    rows = await fetch_rows(queryset[: page_size + 1])
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    next_cursor = encode_cursor(*cursor_key(rows[-1])) if has_more else None
+    return rows, next_cursor, has_more
@@ -0,0 +1,72 @@
+from hashlib import sha256
+
+from django.core.cache import cache
+from graphql import GraphQLError
+from strawberry.http.exceptions import HTTPException
+from strawberry.types import ExecutionResult
+
+# Apollo's automatic persisted queries: once a client has sent a query with
+# its sha256 hash, later requests may send only the hash
+PERSISTED_QUERY_TIMEOUT = 60 * 60 * 24
+
+
+class PersistedQueryNotFound(Exception):
+    pass
+
+
+def persisted_query_key(query_hash: str) -> str:
+    return f"apq:{query_hash}"
+
+
+class PersistedQueryViewMixin:
+    async def parse_http_body(self, request):
+        request_data = await super().parse_http_body(request)
+
+        if request.method == "GET":
+            extensions = request.query_params.get("extensions")
+        else:
+            body = await request.get_body()
+            # Only decode the body again when it can carry a persisted query
+            extensions = (
+                self.parse_json(body).get("extensions")
+                if "persistedQuery" in body
+                else None
+            )
+        if isinstance(extensions, str):
+            extensions = self.parse_json(extensions)
+
+        query_hash = ((extensions or {}).get("persistedQuery") or {}).get(
+            "sha256Hash"
+        )
+        if not query_hash:
+            return request_data
+
+        if request_data.query is None:
+            request_data.query = await cache.aget(persisted_query_key(query_hash))
+            if request_data.query is None:
+                raise PersistedQueryNotFound()
+        elif sha256(request_data.query.encode()).hexdigest() == query_hash:
+            await cache.aset(
+                persisted_query_key(query_hash),
+                request_data.query,
+                PERSISTED_QUERY_TIMEOUT,
+            )
+        else:
+            raise HTTPException(400, "provided sha does not match query")
+
+        return request_data
+
+    async def execute_operation(self, request, context, root_value):
+        try:
+            return await super().execute_operation(request, context, root_value)
+        except PersistedQueryNotFound:
+            # Tells the client to retry with the full query text
+            return ExecutionResult(
+                data=None,
+                errors=[
+                    GraphQLError(
+                        "PersistedQueryNotFound",
+                        extensions={"code": "PERSISTED_QUERY_NOT_FOUND"},
+                    )
+                ],
+            )
@@ -1,9 +1,10 @@
 import strawberry
+from strawberry.extensions import ParserCache, ValidationCache
+from .introspection import IntrospectionCache
 from apps.ingredients.queries import Query as IngredientQuery
 from apps.ingredients.mutations import Mutation as IngredientMutation
 from apps.recipes.queries import Query as RecipeQuery
 from apps.recipes.mutations import Mutation as RecipeMutation
-from strawberry.types import Info
 
 
 @strawberry.type
@@ -18,4 +19,14 @@ class Mutation(
     pass
 
 
-schema = strawberry.Schema(query=Query, mutation=Mutation)
+schema = strawberry.Schema(
+    query=Query,
+    mutation=Mutation,
+    # Clients send the same few documents, so skip re-parsing and re-validating
+    # them; bounded so arbitrary queries can't grow the caches without limit
+    extensions=[
+        ParserCache(maxsize=1024),
+        ValidationCache(maxsize=1024),
+        IntrospectionCache(),
+    ],
+)
@@ -0,0 +1,12 @@
+# Trigram indexes can't narrow patterns shorter than one trigram
+MIN_SUBSTRING_SEARCH_LENGTH = 3
+
+
+def search_by_name(queryset, search: str):
+    """
+    Substring match on name, or prefix match for searches too short for the
+    trigram index (served by the name pattern index instead)
+    """
+    if len(search) < MIN_SUBSTRING_SEARCH_LENGTH:
+        return queryset.filter(name__istartswith=search)
+    return queryset.filter(name__icontains=search)
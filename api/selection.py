@@ -0,0 +1,41 @@
+from typing import Set
+from strawberry.types import Info
+from strawberry.types.nodes import SelectedField
+from strawberry.utils.str_converters import to_snake_case
+
+
+def _fields(selections):
+    for selection in selections:
+        if isinstance(selection, SelectedField):
+            yield selection
+        else:
+            # Fragment spreads and inline fragments carry their own selections
+            yield from _fields(selection.selections)
+
+
+def selected_field_names(info: Info, *path: str) -> Set[str]:
+    """
+    Snake-cased names of the fields requested under the current field,
+    following `path` into nested objects (e.g. "data" on page types)
+    """
+    fields = [
+        child for field in info.selected_fields for child in _fields(field.selections)
+    ]
+    for name in path:
+        fields = [
+            child
+            for field in fields
+            if field.name == name
+            for child in _fields(field.selections)
+        ]
+    return {to_snake_case(field.name) for field in fields}
+
+
+def only_selected(queryset, field_names: Set[str], *always: str):
+    """
+    Restrict the SELECT to the requested model columns plus the primary key
+    and any columns the resolver itself needs (e.g. cursor keys)
+    """
+    model = queryset.model
+    columns = {field.name for field in model._meta.concrete_fields}
+    return queryset.only(model._meta.pk.name, *always, *(field_names & columns))
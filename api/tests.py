@@ -0,0 +1,194 @@
+import json
+from hashlib import sha256
+from typing import List, Optional
+from unittest import mock
+
+import strawberry
+import strawberry.schema.execute
+from django.core.cache import cache
+from django.test import AsyncRequestFactory, SimpleTestCase
+from graphql import parse
+from strawberry.django.views import AsyncGraphQLView
+from strawberry.types import Info
+
+from apps.ingredients.models import Ingredient
+from .introspection import IntrospectionCache, is_introspection
+from .pagination import decode_cursor, encode_cursor
+from .persisted_queries import PersistedQueryViewMixin
+from .selection import only_selected, selected_field_names
+
+
+@strawberry.type
+class Recorded:
+    names: List[str]
+    unit_name: str = ""
+    data: List["Recorded"] = strawberry.field(default_factory=list)
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def hello(self) -> str:
+        return "world"
+
+    @strawberry.field
+    def recorded(self, info: Info, path: Optional[str] = None) -> Recorded:
+        # Reports what selected_field_names saw for this field
+        names = selected_field_names(info, *([path] if path else []))
+        return Recorded(names=sorted(names))
+
+
+schema = strawberry.Schema(query=Query)
+
+
+class PersistedQueryView(PersistedQueryViewMixin, AsyncGraphQLView):
+    pass
+
+
+class CursorTests(SimpleTestCase):
+    def test_round_trip(self):
+        cursor = encode_cursor("2024-11-12T10:15:00+00:00", 42)
+        self.assertEqual(decode_cursor(cursor), ["2024-11-12T10:15:00+00:00", 42])
+
+    def test_invalid_cursor(self):
+        with self.assertRaisesMessage(ValueError, "Invalid cursor."):
+            decode_cursor("not a cursor")
+
+
+class SelectionTests(SimpleTestCase):
+    def names(self, query):
+        result = schema.execute_sync(query)
+        self.assertIsNone(result.errors)
+        return result.data["recorded"]["names"]
+
+    def test_snake_cases_direct_fields(self):
+        names = self.names("{ recorded { names unitName } }")
+        self.assertEqual(names, ["names", "unit_name"])
+
+    def test_follows_path_through_fragments(self):
+        names = self.names(
+            """
+            query {
+                recorded(path: "data") {
+                    names
+                    data { unitName ...Nested ... on Recorded { names } }
+                }
+            }
+            fragment Nested on Recorded { data { names } }
+            """
+        )
+        self.assertEqual(names, ["data", "names", "unit_name"])
+
+    def test_only_selected_keeps_pk_and_always_columns(self):
+        queryset = only_selected(
+            Ingredient.objects.all(), {"name", "not_a_column"}, "created_at"
+        )
+        fields, defer = queryset.query.deferred_loading
+        self.assertFalse(defer)
+        self.assertEqual(set(fields), {"id", "name", "created_at"})
+
+
+class PersistedQueryTests(SimpleTestCase):
+    query = "{ hello }"
+    query_hash = sha256(query.encode()).hexdigest()
+
+    def setUp(self):
+        cache.clear()
+        self.factory = AsyncRequestFactory()
+        self.view = PersistedQueryView.as_view(schema=schema)
+
+    def extensions(self, query_hash=None):
+        query_hash = query_hash or self.query_hash
+        return {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}
+
+    async def post(self, body):
+        request = self.factory.post(
+            "/graphql/", json.dumps(body), content_type="application/json"
+        )
+        return await self.view(request)
+
+    async def test_unknown_hash(self):
+        response = await self.post({"extensions": self.extensions()})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            json.loads(response.content)["errors"][0]["extensions"],
+            {"code": "PERSISTED_QUERY_NOT_FOUND"},
+        )
+
+    async def test_registered_hash_over_post_and_get(self):
+        response = await self.post(
+            {"query": self.query, "extensions": self.extensions()}
+        )
+        self.assertEqual(json.loads(response.content), {"data": {"hello": "world"}})
+
+        response = await self.post({"extensions": self.extensions()})
+        self.assertEqual(json.loads(response.content), {"data": {"hello": "world"}})
+
+        request = self.factory.get(
+            "/graphql/", {"extensions": json.dumps(self.extensions())}
+        )
+        response = await self.view(request)
+        self.assertEqual(json.loads(response.content), {"data": {"hello": "world"}})
+
+    async def test_hash_mismatch(self):
+        response = await self.post(
+            {"query": self.query, "extensions": self.extensions("0" * 64)}
+        )
+        self.assertEqual(response.status_code, 400)
+
+    async def test_plain_query_untouched(self):
+        response = await self.post({"query": self.query})
+        self.assertEqual(json.loads(response.content), {"data": {"hello": "world"}})
+
+
+class IntrospectionCacheTests(SimpleTestCase):
+    schema_query = "{ __schema { queryType { name } } }"
+
+    def setUp(self):
+        self.extension = IntrospectionCache()
+        self.schema = strawberry.Schema(query=Query, extensions=[self.extension])
+
+    def execute(self, query, variables=None):
+        # Counts the documents graphql-core actually executed
+        with mock.patch.object(
+            strawberry.schema.execute,
+            "original_execute",
+            wraps=strawberry.schema.execute.original_execute,
+        ) as execute:
+            result = self.schema.execute_sync(query, variable_values=variables)
+        self.assertIsNone(result.errors)
+        return result, execute.call_count
+
+    def test_repeated_introspection_served_from_cache(self):
+        first, executed = self.execute(self.schema_query)
+        self.assertEqual(executed, 1)
+
+        second, executed = self.execute(self.schema_query)
+        self.assertEqual(executed, 0)
+        self.assertEqual(second.data, first.data)
+
+    def test_mixed_document_not_cached(self):
+        query = "{ __typename hello }"
+        self.execute(query)
+        _, executed = self.execute(query)
+        self.assertEqual(executed, 1)
+        self.assertEqual(self.extension.results, {})
+
+    def test_fragment_spread_not_cached(self):
+        query = "{ ...Typename } fragment Typename on Query { __typename }"
+        self.execute(query)
+        self.assertEqual(self.extension.results, {})
+
+    def test_query_with_variables_not_cached(self):
+        query = "query ($full: Boolean!) { __typename @include(if: $full) }"
+        self.execute(query, {"full": True})
+        self.assertEqual(self.extension.results, {})
+
+    def test_is_introspection_skips_fragment_definitions(self):
+        document = parse("{ __typename } fragment Unused on Query { hello }")
+        self.assertTrue(is_introspection(document))
+
+    def test_cache_is_capped(self):
+        for index in range(self.extension.maxsize + 1):
+            self.execute(f"{{ alias{index}: __typename }}")
+        self.assertEqual(len(self.extension.results), 32)
@@ -7,3 +7,9 @@ class IngredientInput:
     name: str
     description: str
     unit: str
+
+    def __post_init__(self):
+        # Normalize once while decoding so resolvers read clean values
+        self.name = self.name.strip()
+        self.description = self.description.strip()
+        self.unit = self.unit.strip().lower()
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.3 on 2024-11-15 10:30
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ingredients", "0003_ingredient_uniq_ing_name_ci"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="ingredient",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"),
+                    name="text_pattern_ops",
+                ),
+                name="ingredient_name_prefix_idx",
+            ),
+        ),
+    ]
@@ -1,5 +1,7 @@
 
 from django.db import models
+from django.db.models.functions import Lower, Upper
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.validators import MinValueValidator
 
 class Ingredient(models.Model):
@@ -13,4 +15,19 @@ class Ingredient(models.Model):
         return self.name
 
     class Meta:
-        ordering = ['name']
\ No newline at end of file
+        ordering = ['name']
+        indexes = [
+            # icontains compiles to UPPER(name) LIKE ..., so index that expression
+            GinIndex(
+                OpClass(Upper('name'), name='gin_trgm_ops'),
+                name='ingredient_name_trgm_idx',
+            ),
+            # Short searches fall back to istartswith, i.e. UPPER(name) LIKE 'x%'
+            models.Index(
+                OpClass(Upper('name'), name='text_pattern_ops'),
+                name='ingredient_name_prefix_idx',
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(Lower('name'), name='uniq_ing_name_ci'),
+        ]
@@ -11,14 +11,10 @@ from .responses import IngredientResponse, IngredientError
 @strawberry.type
 class Mutation:
     @strawberry.mutation
-    def create_ingredient(
+    async def create_ingredient(
         self, info: Info, input: IngredientInput
     ) -> IngredientResponse:
-        name, description, unit = (
-            input.name.strip(),
-            input.description.strip(),
-            input.unit.strip().lower(),
-        )
+        name, description, unit = input.name, input.description, input.unit
 
         if not name or not unit:
             return IngredientResponse(
@@ -29,36 +25,32 @@ class Mutation:
             )
 
         try:
-            if Ingredient.objects.filter(name__iexact=name).exists():
-                return IngredientResponse(
-                    success=False,
-                    error=IngredientError(
-                        message="Duplicate ingredient name", code="DUPLICATE_NAME"
-                    ),
-                )
-
             ingredient = Ingredient(name=name, description=description, unit=unit)
-            ingredient.full_clean()
-            ingredient.save()
+            # Field validators only; uniqueness is enforced by the DB constraint
+            ingredient.clean_fields()
+            await ingredient.asave()
             return IngredientResponse(success=True, ingredient=ingredient)
 
-        except (ValidationError, IntegrityError) as e:
+        except IntegrityError:
+            return IngredientResponse(
+                success=False,
+                error=IngredientError(
+                    message="Duplicate ingredient name", code="DUPLICATE_NAME"
+                ),
+            )
+        except ValidationError as e:
             return IngredientResponse(
                 success=False,
                 error=IngredientError(message=str(e), code="DATABASE_ERROR"),
             )
 
     @strawberry.mutation
-    def update_ingredient(
+    async def update_ingredient(
         self, info: Info, id: int, input: IngredientInput
     ) -> IngredientResponse:
         try:
-            ingredient = Ingredient.objects.get(pk=id)
-            name, description, unit = (
-                input.name.strip(),
-                input.description.strip(),
-                input.unit.strip().lower(),
-            )
+            ingredient = await Ingredient.objects.aget(pk=id)
+            name, description, unit = input.name, input.description, input.unit
 
             if not name:
                 return IngredientResponse(
@@ -68,21 +60,13 @@ class Mutation:
                     ),
                 )
 
-            if Ingredient.objects.filter(name__iexact=name).exclude(pk=id).exists():
-                return IngredientResponse(
-                    success=False,
-                    error=IngredientError(
-                        message="Duplicate ingredient name", code="DUPLICATE_NAME"
-                    ),
-                )
-
             ingredient.name, ingredient.description, ingredient.unit = (
                 name,
                 description,
                 unit,
             )
-            ingredient.full_clean()
-            ingredient.save()
+            ingredient.clean_fields()
+            await ingredient.asave()
             return IngredientResponse(success=True, ingredient=ingredient)
 
         except Ingredient.DoesNotExist:
@@ -90,16 +74,26 @@ class Mutation:
                 success=False,
                 error=IngredientError(message="Ingredient not found", code="NOT_FOUND"),
             )
+        except IntegrityError:
+            return IngredientResponse(
+                success=False,
+                error=IngredientError(
+                    message="Duplicate ingredient name", code="DUPLICATE_NAME"
+                ),
+            )
+        except ValidationError as e:
+            return IngredientResponse(
+                success=False,
+                error=IngredientError(message=str(e), code="DATABASE_ERROR"),
+            )
 
     @strawberry.mutation
-    def delete_ingredient(self, info: Info, id: int) -> IngredientResponse:
-        try:
-            ingredient = Ingredient.objects.get(pk=id)
-            ingredient.delete()
-            return IngredientResponse(success=True, ingredient=ingredient)
-
-        except Ingredient.DoesNotExist:
+    async def delete_ingredient(self, info: Info, id: int) -> IngredientResponse:
+        deleted, _ = await Ingredient.objects.filter(pk=id).only("pk").adelete()
+        if not deleted:
             return IngredientResponse(
                 success=False,
                 error=IngredientError(message="Ingredient not found", code="NOT_FOUND"),
             )
+
+        return IngredientResponse(success=True, ingredient=None)
@@ -8,23 +8,27 @@
 import strawberry
 from typing import List, Optional
 from strawberry.types import Info
-from django.core.paginator import Paginator
 from django.core.exceptions import ObjectDoesNotExist
-from .types import IngredientType
+from api.pagination import decode_cursor, fetch_rows, keyset_page
+from api.search import search_by_name
+from api.selection import only_selected, selected_field_names
+from .types import IngredientType, IngredientPage
 from .models import Ingredient
 
 
 @strawberry.type
 class Query:
     @strawberry.field
-    def ingredient(self, info: Info, id: int) -> Optional[IngredientType]:
+    async def ingredient(self, info: Info, id: int) -> Optional[IngredientType]:
         try:
-            return Ingredient.objects.get(pk=id)
+            return await only_selected(
+                Ingredient.objects.all(), selected_field_names(info)
+            ).aget(pk=id)
         except ObjectDoesNotExist:
             return None
 
-    @strawberry.field
-    def ingredients(
+    @strawberry.field(deprecation_reason="Use ingredientsPage for cursor pagination.")
+    async def ingredients(
         self,
         info: Info,
         page: int = 1,
@@ -34,10 +38,42 @@ class Query:
         if page <= 0 or page_size <= 0:
             raise ValueError("Page number and page size must be greater than 0.")
 
-        queryset = Ingredient.objects.all()
+        queryset = only_selected(Ingredient.objects.all(), selected_field_names(info))
+
+        if search:
+            queryset = search_by_name(queryset, search)
+
+        # Slicing past the end yields an empty page, so no COUNT(*) is needed
+        offset = (page - 1) * page_size
+        return await fetch_rows(queryset[offset : offset + page_size])
+
+    @strawberry.field
+    async def ingredients_page(
+        self,
+        info: Info,
+        cursor: Optional[str] = None,
+        page_size: int = 10,
+        search: Optional[str] = None,
+    ) -> IngredientPage:
+        if page_size <= 0:
+            raise ValueError("Page size must be greater than 0.")
+
+        queryset = only_selected(
+            Ingredient.objects.order_by("name"),
+            selected_field_names(info, "data"),
+            "name",
+        )
 
         if search:
-            queryset = queryset.filter(name__icontains=search)
+            queryset = search_by_name(queryset, search)
+
+        if cursor:
+            # Names are unique, so the name alone orders the pages and the
+            # unique index on it serves the seek
+            (last_name,) = decode_cursor(cursor)
+            queryset = queryset.filter(name__gt=last_name)
 
-        paginator = Paginator(queryset, page_size)
-        return list(paginator.get_page(page)) if page <= paginator.num_pages else []
+        data, next_cursor, has_more = await keyset_page(
+            queryset, page_size, lambda ingredient: (ingredient.name,)
+        )
+        return IngredientPage(data=data, next_cursor=next_cursor, has_more=has_more)
@@ -1,3 +1,4 @@
+from typing import List, Optional
 from strawberry import auto
 from .models import Ingredient
 import strawberry
@@ -11,3 +12,10 @@ class IngredientType:
     unit: auto
     created_at: auto
     updated_at: auto
+
+
+@strawberry.type
+class IngredientPage:
+    data: List[IngredientType]
+    next_cursor: Optional[str]
+    has_more: bool
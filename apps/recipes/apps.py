@@ -4,4 +4,7 @@ from django.apps import AppConfig
 class RecipesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.recipes"
-    label= "recipes"
\ No newline at end of file
+    label= "recipes"
+
+    def ready(self):
+        from . import signals  # noqa: F401
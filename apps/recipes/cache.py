@@ -0,0 +1,72 @@
+import time
+from typing import Optional
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import Recipe
+
+# Seconds a cached recipe may be served for; writes invalidate it sooner
+RECIPE_CACHE_TIMEOUT = 300
+# Outlives every row cached under it; a version that expires is re-seeded
+# from the clock, which only turns those rows into misses
+RECIPE_VERSION_TIMEOUT = RECIPE_CACHE_TIMEOUT * 2
+
+
+def recipe_version_key(recipe_id) -> str:
+    return f"recipe-version:{recipe_id}"
+
+
+def recipe_cache_key(recipe_id, version) -> str:
+    return f"recipe:{recipe_id}:{version}"
+
+
+def _field_names():
+    return [field.attname for field in Recipe._meta.concrete_fields]
+
+
+async def recipe_cache_version(recipe_id) -> int:
+    """
+    Read before loading the row: a write committed in between bumps the
+    version, so the stale row is then cached under a key nobody reads
+    """
+    # Seeded from the clock so a version lost to eviction is never reused
+    return await cache.aget_or_set(
+        recipe_version_key(recipe_id),
+        time.time_ns,
+        timeout=RECIPE_VERSION_TIMEOUT,
+    )
+
+
+async def get_cached_recipe(recipe_id, version) -> Optional[Recipe]:
+    # Rows are stored as plain values rather than pickled model instances
+    values = await cache.aget(recipe_cache_key(recipe_id, version))
+    if values is None:
+        return None
+
+    *row, ingredient_count = values
+    recipe = Recipe.from_db("default", _field_names(), row)
+    recipe._ingredient_count = ingredient_count
+    return recipe
+
+
+async def cache_recipe(recipe: Recipe, version) -> None:
+    """Cache a recipe loaded with every column and the _ingredient_count annotation"""
+    values = [getattr(recipe, name) for name in _field_names()]
+    values.append(recipe._ingredient_count)
+    await cache.aset(
+        recipe_cache_key(recipe.pk, version), values, RECIPE_CACHE_TIMEOUT
+    )
+
+
+def _bump_version(recipe_id) -> None:
+    key = recipe_version_key(recipe_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), timeout=RECIPE_VERSION_TIMEOUT)
+
+
+def invalidate_recipe(recipe_id) -> None:
+    # Bumped on commit: bumping earlier would let a reader pick up the new
+    # version while still seeing the old row
+    transaction.on_commit(lambda: _bump_version(recipe_id))
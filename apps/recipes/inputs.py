@@ -7,6 +7,9 @@ class RecipeIngredientInput:
     quantity: float
     notes: Optional[str] = ""
 
+    def __post_init__(self):
+        self.notes = (self.notes or "").strip()
+
 
 @strawberry.input
 class RecipeInput:
@@ -16,9 +19,18 @@ class RecipeInput:
     cooking_time: int
     ingredients: List[RecipeIngredientInput]
 
+    def __post_init__(self):
+        # Normalize once while decoding so resolvers read clean values
+        self.name = self.name.strip()
+        self.description = self.description.strip()
+        self.instructions = self.instructions.strip()
+
 
 @strawberry.input
 class BulkUpdateRecipeIngredientInput:
     ingredient_id: int
     quantity: float
     notes: Optional[str] = ""
+
+    def __post_init__(self):
+        self.notes = (self.notes or "").strip()
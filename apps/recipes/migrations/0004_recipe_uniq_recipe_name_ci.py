@@ -0,0 +1,20 @@
+# Generated by Django 5.1.3 on 2024-11-13 09:05
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("recipes", "0003_recipe_name_trgm_idx"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="recipe",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("name"), name="uniq_recipe_name_ci"
+            ),
+        ),
+    ]
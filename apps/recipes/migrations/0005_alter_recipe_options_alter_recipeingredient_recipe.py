@@ -0,0 +1,27 @@
+# Generated by Django 5.1.3 on 2024-11-14 11:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("recipes", "0004_recipe_uniq_recipe_name_ci"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="recipe",
+            options={"ordering": ["-created_at", "-id"]},
+        ),
+        migrations.AlterField(
+            model_name="recipeingredient",
+            name="recipe",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="recipes.recipe",
+            ),
+        ),
+    ]
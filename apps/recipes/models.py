@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.functions import Lower, Upper
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from apps.ingredients.models import Ingredient
 
 class Recipe(models.Model):
@@ -19,13 +21,33 @@ class Recipe(models.Model):
 
     @property
     def ingredient_count(self):
+        # List queries annotate the count so each recipe doesn't run its own COUNT
+        if hasattr(self, "_ingredient_count"):
+            return self._ingredient_count
         return self.ingredients.count()
 
     class Meta:
-        ordering = ['-created_at']
+        ordering = ['-created_at', '-id']
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='recipe_created_id_idx'),
+            # icontains compiles to UPPER(name) LIKE ..., so index that expression
+            GinIndex(
+                OpClass(Upper('name'), name='gin_trgm_ops'),
+                name='recipe_name_trgm_idx',
+            ),
+            # Short searches fall back to istartswith, i.e. UPPER(name) LIKE 'x%'
+            models.Index(
+                OpClass(Upper('name'), name='text_pattern_ops'),
+                name='recipe_name_prefix_idx',
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(Lower('name'), name='uniq_recipe_name_ci'),
+        ]
 
 class RecipeIngredient(models.Model):
-    recipe = models.ForeignKey(Recipe, on_delete=models.CASCADE)
+    # Lookups by recipe are served by the unique_together index below
+    recipe = models.ForeignKey(Recipe, on_delete=models.CASCADE, db_index=False)
     ingredient = models.ForeignKey(Ingredient, on_delete=models.CASCADE)
     quantity = models.DecimalField(max_digits=10, decimal_places=2)
     notes = models.CharField(max_length=200, blank=True)
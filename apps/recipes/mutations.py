@@ -6,83 +6,203 @@
 # - Delete Recipe- Delete a recipe and its ingredient associations.
 
 
+from collections import Counter
 from typing import Optional, List
 import strawberry
 from strawberry.types import Info
-from django.db import transaction
+from asgiref.sync import sync_to_async
+from django.db import IntegrityError, connection, transaction
 from django.core.exceptions import ValidationError
 
+from .cache import invalidate_recipe
 from .models import Recipe, RecipeIngredient
 from apps.ingredients.models import Ingredient
 from .inputs import RecipeInput, BulkUpdateRecipeIngredientInput
 from .responses import RecipeResponse, RecipeError
 
 
-@strawberry.type
-class Mutation:
-    @strawberry.mutation
-    def create_recipe(self, info: Info, input: RecipeInput) -> RecipeResponse:
-        try:
-            with transaction.atomic():
-                # Validate name
-                name = input.name.strip()
-                if not name:
-                    return RecipeResponse(
-                        success=False,
-                        error=RecipeError(
-                            message="Name cannot be empty", code="EMPTY_NAME"
-                        ),
+# Resolvers are async; the multi-statement transactions below run in Django's
+# sync thread because the async ORM can't open a transaction.
+
+# Caps rows per INSERT/UPDATE statement so large ingredient lists stay under
+# the database's bind parameter limit
+BULK_BATCH_SIZE = 500
+
+# Failures with fixed text are built once and returned as-is; ones that
+# embed a name or exception message are built where they happen
+EMPTY_NAME_RESPONSE = RecipeResponse(
+    success=False,
+    error=RecipeError(message="Name cannot be empty", code="EMPTY_NAME"),
+)
+RECIPE_NOT_FOUND_RESPONSE = RecipeResponse(
+    success=False,
+    error=RecipeError(message="Recipe not found", code="NOT_FOUND"),
+)
+INGREDIENT_NOT_FOUND_RESPONSE = RecipeResponse(
+    success=False,
+    error=RecipeError(
+        message="Ingredient matching query does not exist.", code="NOT_FOUND"
+    ),
+)
+INGREDIENT_NOT_IN_RECIPE_RESPONSE = RecipeResponse(
+    success=False,
+    error=RecipeError(message="Ingredient not found in recipe", code="NOT_FOUND"),
+)
+DUPLICATE_INGREDIENT_RESPONSE = RecipeResponse(
+    success=False,
+    error=RecipeError(
+        message="Ingredient already exists in recipe", code="DUPLICATE_INGREDIENT"
+    ),
+)
+
+
+@sync_to_async
+def _create_recipe(input: RecipeInput) -> RecipeResponse:
+    try:
+        with transaction.atomic():
+            # Validate name
+            name = input.name
+            if not name:
+                return EMPTY_NAME_RESPONSE
+
+            # Look up every ingredient in one query before creating anything
+            ingredient_ids = [i.ingredient_id for i in input.ingredients]
+            ingredients = Ingredient.objects.in_bulk(ingredient_ids)
+            missing = [str(pk) for pk in ingredient_ids if pk not in ingredients]
+            if missing:
+                raise ValidationError(f"Ingredient with ID {', '.join(missing)} not found")
+
+            # A recipe holds each ingredient once (unique_together)
+            repeated = [
+                str(pk) for pk, count in Counter(ingredient_ids).items() if count > 1
+            ]
+            if repeated:
+                raise ValidationError(
+                    f"Ingredient with ID {', '.join(repeated)} listed more than once"
+                )
+
+            # Create recipe, letting the case-insensitive unique constraint
+            # catch duplicate names
+            try:
+                with transaction.atomic():
+                    recipe = Recipe.objects.create(
+                        name=name,
+                        description=input.description,
+                        instructions=input.instructions,
+                        cooking_time=input.cooking_time,
                     )
+            except IntegrityError:
+                return RecipeResponse(
+                    success=False,
+                    error=RecipeError(
+                        message=f"Recipe with name '{name}' already exists",
+                        code="DUPLICATE_NAME",
+                    ),
+                )
 
-                # Check for duplicate recipe name
-                if Recipe.objects.filter(name__iexact=name).exists():
-                    return RecipeResponse(
-                        success=False,
-                        error=RecipeError(
-                            message=f"Recipe with name '{name}' already exists",
-                            code="DUPLICATE_NAME",
-                        ),
+            # Add ingredients
+            RecipeIngredient.objects.bulk_create(
+                [
+                    RecipeIngredient(
+                        recipe=recipe,
+                        ingredient=ingredients[ingredient_input.ingredient_id],
+                        quantity=ingredient_input.quantity,
+                        notes=ingredient_input.notes,
                     )
+                    for ingredient_input in input.ingredients
+                ],
+                batch_size=BULK_BATCH_SIZE,
+            )
 
-                # Create recipe
-                recipe = Recipe.objects.create(
-                    name=name,
-                    description=input.description.strip(),
-                    instructions=input.instructions.strip(),
-                    cooking_time=input.cooking_time,
-                )
+            return RecipeResponse(success=True, recipe=recipe)
 
-                # Add ingredients
-                for ingredient_input in input.ingredients:
-                    try:
-                        ingredient = Ingredient.objects.get(
-                            pk=ingredient_input.ingredient_id
-                        )
-                        RecipeIngredient.objects.create(
-                            recipe=recipe,
-                            ingredient=ingredient,
-                            quantity=ingredient_input.quantity,
-                            notes=ingredient_input.notes.strip(),
-                        )
-                    except Ingredient.DoesNotExist:
-                        raise ValidationError(
-                            f"Ingredient with ID {ingredient_input.ingredient_id} not found"
-                        )
-
-                return RecipeResponse(success=True, recipe=recipe)
-
-        except ValidationError as e:
-            return RecipeResponse(
-                success=False,
-                error=RecipeError(message=str(e), code="VALIDATION_ERROR"),
+    except ValidationError as e:
+        return RecipeResponse(
+            success=False,
+            error=RecipeError(message=str(e), code="VALIDATION_ERROR"),
+        )
+
+
+@sync_to_async
+def _bulk_update_recipe_ingredients(
+    recipe_id: int, ingredients: List[BulkUpdateRecipeIngredientInput]
+) -> RecipeResponse:
+    try:
+        recipe = Recipe.objects.get(pk=recipe_id)
+
+        # Later entries for the same ingredient win, as with repeated upserts
+        updates = {i.ingredient_id: i for i in ingredients}
+
+        found = set(
+            Ingredient.objects.filter(pk__in=updates).values_list("pk", flat=True)
+        )
+        missing = [str(pk) for pk in updates if pk not in found]
+        if missing:
+            raise Ingredient.DoesNotExist(
+                f"Ingredient with ID {', '.join(missing)} not found"
             )
-        except Exception as e:
-            return RecipeResponse(
-                success=False, error=RecipeError(message=str(e), code="INTERNAL_ERROR")
+
+        with transaction.atomic():
+            # One upsert per batch: inserting a pair another request just
+            # added updates it instead of failing on unique_together
+            RecipeIngredient.objects.bulk_create(
+                [
+                    RecipeIngredient(
+                        recipe=recipe,
+                        ingredient_id=ingredient_id,
+                        quantity=ingredient_data.quantity,
+                        notes=ingredient_data.notes,
+                    )
+                    for ingredient_id, ingredient_data in updates.items()
+                ],
+                update_conflicts=True,
+                unique_fields=["recipe", "ingredient"],
+                update_fields=["quantity", "notes"],
+                batch_size=BULK_BATCH_SIZE,
             )
+            # Bulk writes don't send the signals that invalidate the cache
+            invalidate_recipe(recipe.pk)
+
+        return RecipeResponse(success=True, recipe=recipe)
+
+    except Recipe.DoesNotExist:
+        return RECIPE_NOT_FOUND_RESPONSE
+    except Ingredient.DoesNotExist as e:
+        return RecipeResponse(
+            success=False,
+            error=RecipeError(message=str(e), code="NOT_FOUND")
+        )
+
 
+@sync_to_async
+def _remove_recipe_ingredient(recipe_id: int, ingredient_id: int) -> bool:
+    # Nothing cascades from RecipeIngredient, so a single DELETE replaces the
+    # collector's SELECT-then-DELETE; that also skips the post_delete signal,
+    # hence the explicit cache invalidation
+    meta = RecipeIngredient._meta
+    quote_name = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {quote_name(meta.db_table)} "
+            f"WHERE {quote_name(meta.get_field('recipe').column)} = %s "
+            f"AND {quote_name(meta.get_field('ingredient').column)} = %s",
+            [recipe_id, ingredient_id],
+        )
+        deleted = cursor.rowcount
+
+    if deleted:
+        invalidate_recipe(recipe_id)
+    return bool(deleted)
+
+
+@strawberry.type
+class Mutation:
     @strawberry.mutation
-    def add_one_ingredient_to_recipe(
+    async def create_recipe(self, info: Info, input: RecipeInput) -> RecipeResponse:
+        return await _create_recipe(input)
+
+    @strawberry.mutation
+    async def add_one_ingredient_to_recipe(
         self,
         info: Info,
         recipe_id: int,
@@ -91,125 +211,60 @@ class Mutation:
         notes: Optional[str] = "",
     ) -> RecipeResponse:
         try:
-            recipe = Recipe.objects.get(pk=recipe_id)
-            ingredient = Ingredient.objects.get(pk=ingredient_id)
+            recipe = await info.context.recipe_loader.load(recipe_id)
 
-            if RecipeIngredient.objects.filter(
-                recipe=recipe, ingredient=ingredient
-            ).exists():
-                return RecipeResponse(
-                    success=False,
-                    error=RecipeError(
-                        message="Ingredient already exists in recipe",
-                        code="DUPLICATE_INGREDIENT",
-                    ),
-                )
-
-            RecipeIngredient.objects.create(
+            # The (recipe, ingredient) unique constraint makes this race-safe;
+            # an unknown ingredient surfaces as the foreign key failing
+            _, created = await RecipeIngredient.objects.aget_or_create(
                 recipe=recipe,
-                ingredient=ingredient,
-                quantity=quantity,
-                notes=notes.strip(),
+                ingredient_id=ingredient_id,
+                defaults={"quantity": quantity, "notes": (notes or "").strip()},
             )
+            if not created:
+                return DUPLICATE_INGREDIENT_RESPONSE
+            # Drop any ingredient lists this request already loaded
+            info.context.recipe_ingredients_loader.clear_all()
 
             return RecipeResponse(success=True, recipe=recipe)
 
-        except (Recipe.DoesNotExist, Ingredient.DoesNotExist) as e:
+        except Recipe.DoesNotExist as e:
             return RecipeResponse(
                 success=False, error=RecipeError(message=str(e), code="NOT_FOUND")
             )
-        except Exception as e:
-            return RecipeResponse(
-                success=False, error=RecipeError(message=str(e), code="INTERNAL_ERROR")
-            )
+        except IntegrityError:
+            return INGREDIENT_NOT_FOUND_RESPONSE
 
     @strawberry.mutation
-    def remove_one_ingredient_from_recipe(
+    async def remove_one_ingredient_from_recipe(
         self, info: Info, recipe_id: int, ingredient_id: int
     ) -> RecipeResponse:
-        try:
-            recipe = Recipe.objects.get(pk=recipe_id)
-            ingredient = Ingredient.objects.get(pk=ingredient_id)
-
-            recipe_ingredient = RecipeIngredient.objects.filter(
-                recipe=recipe, ingredient=ingredient
-            ).first()
-
-            if not recipe_ingredient:
-                return RecipeResponse(
-                    success=False,
-                    error=RecipeError(
-                        message="Ingredient not found in recipe", code="NOT_FOUND"
-                    ),
-                )
-
-            recipe_ingredient.delete()
-            return RecipeResponse(success=True, recipe=recipe)
-
-        except (Recipe.DoesNotExist, Ingredient.DoesNotExist) as e:
-            return RecipeResponse(
-                success=False, error=RecipeError(message=str(e), code="NOT_FOUND")
-            )
-        except Exception as e:
-            return RecipeResponse(
-                success=False, error=RecipeError(message=str(e), code="INTERNAL_ERROR")
-            )
+        # An unknown recipe or ingredient simply deletes nothing
+        if not await _remove_recipe_ingredient(recipe_id, ingredient_id):
+            return INGREDIENT_NOT_IN_RECIPE_RESPONSE
 
-    @strawberry.mutation
-    def delete_recipe(self, info: Info, recipe_id: int) -> RecipeResponse:
+        info.context.recipe_ingredients_loader.clear_all()
         try:
-            recipe = Recipe.objects.get(pk=recipe_id)
-            recipe.delete()
+            # A concurrent delete_recipe may have removed the recipe meanwhile
+            recipe = await info.context.recipe_loader.load(recipe_id)
+        except Recipe.DoesNotExist:
+            return RECIPE_NOT_FOUND_RESPONSE
+        return RecipeResponse(success=True, recipe=recipe)
 
-            return RecipeResponse(success=True, recipe=None)
+    @strawberry.mutation
+    async def delete_recipe(self, info: Info, recipe_id: int) -> RecipeResponse:
+        deleted, _ = await Recipe.objects.filter(pk=recipe_id).only("pk").adelete()
+        if not deleted:
+            return RECIPE_NOT_FOUND_RESPONSE
 
-        except Recipe.DoesNotExist:
-            return RecipeResponse(
-                success=False,
-                error=RecipeError(message="Recipe not found", code="NOT_FOUND"),
-            )
-        except Exception as e:
-            return RecipeResponse(
-                success=False, error=RecipeError(message=str(e), code="INTERNAL_ERROR")
-            )
+        return RecipeResponse(success=True, recipe=None)
 
     @strawberry.mutation
-    def bulk_update_recipe_ingredients(
+    async def bulk_update_recipe_ingredients(
         self,
         info: Info,
         recipe_id: int,
         ingredients: List[BulkUpdateRecipeIngredientInput]
     ) -> RecipeResponse:
-        try:
-            recipe = Recipe.objects.get(pk=recipe_id)
-
-            for ingredient_data in ingredients:
-                ingredient = Ingredient.objects.get(pk=ingredient_data.ingredient_id)
-
-                # Check if the ingredient exists in the recipe, then update or create it
-                recipe_ingredient, created = RecipeIngredient.objects.update_or_create(
-                    recipe=recipe,
-                    ingredient=ingredient,
-                    defaults={
-                        "quantity": ingredient_data.quantity,
-                        "notes": ingredient_data.notes.strip()
-                    }
-                )
-
-            return RecipeResponse(success=True, recipe=recipe)
-
-        except Recipe.DoesNotExist:
-            return RecipeResponse(
-                success=False,
-                error=RecipeError(message="Recipe not found", code="NOT_FOUND")
-            )
-        except Ingredient.DoesNotExist as e:
-            return RecipeResponse(
-                success=False,
-                error=RecipeError(message=str(e), code="NOT_FOUND")
-            )
-        except Exception as e:
-            return RecipeResponse(
-                success=False,
-                error=RecipeError(message=str(e), code="INTERNAL_ERROR")
-            )
\ No newline at end of file
+        response = await _bulk_update_recipe_ingredients(recipe_id, ingredients)
+        info.context.recipe_ingredients_loader.clear_all()
+        return response
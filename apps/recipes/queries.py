@@ -1,31 +1,124 @@
+from datetime import datetime
 from typing import Optional, List
 import strawberry
 from strawberry.types import Info
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 
-from .models import Recipe
-from .types import RecipeType
+from api.pagination import decode_cursor, fetch_rows, keyset_page
+from api.search import search_by_name
+from api.selection import only_selected, selected_field_names
+from .cache import cache_recipe, get_cached_recipe, recipe_cache_version
+from .models import Recipe, RecipeIngredient
+from .types import RecipeType, RecipePage
+
+
+def ingredient_count():
+    """
+    Per-row correlated COUNT: unlike a joined Count() it needs no GROUP BY,
+    so list queries keep their ORDER BY ... LIMIT plan
+    """
+    return Coalesce(
+        Subquery(
+            RecipeIngredient.objects.filter(recipe=OuterRef("pk"))
+            .order_by()
+            .values("recipe")
+            .annotate(count=Count("pk"))
+            .values("count"),
+            output_field=IntegerField(),
+        ),
+        0,
+    )
+
+
+def recipe_queryset(info: Info, *path: str, always=()):
+    fields = selected_field_names(info, *path)
+    queryset = only_selected(Recipe.objects.all(), fields, *always)
+
+    if "ingredient_count" in fields:
+        queryset = queryset.annotate(_ingredient_count=ingredient_count())
+
+    return queryset
+
+
+def after_cursor(queryset, cursor: str):
+    """Keep only recipes after cursor in (-created_at, -id) order"""
+    last_created_at, last_id = decode_cursor(cursor)
+    last_created_at = datetime.fromisoformat(last_created_at)
+    # The plain bound lets the (created_at, id) index scan start at the
+    # cursor; the OR alone can't be used as an index condition
+    return queryset.filter(created_at__lte=last_created_at).filter(
+        Q(created_at__lt=last_created_at)
+        | Q(created_at=last_created_at, id__lt=last_id)
+    )
 
 
 @strawberry.type
 class Query:
     @strawberry.field
-    def recipe(self, info: Info, id: int) -> Optional[RecipeType]:
+    async def recipe(self, info: Info, id: int) -> Optional[RecipeType]:
+        version = await recipe_cache_version(id)
+        recipe = await get_cached_recipe(id, version)
+        if recipe is not None:
+            return recipe
+
+        # Load the whole row rather than only the selected columns so the
+        # cached entry can serve any selection
         try:
-            return Recipe.objects.get(pk=id)
+            recipe = await Recipe.objects.annotate(
+                _ingredient_count=ingredient_count()
+            ).aget(pk=id)
         except Recipe.DoesNotExist:
             return None
 
-    @strawberry.field
-    def recipes(
+        await cache_recipe(recipe, version)
+        return recipe
+
+    @strawberry.field(deprecation_reason="Use recipesPage for cursor pagination.")
+    async def recipes(
         self,
         info: Info,
         page: int = 1,
         page_size: int = 10,
         search: Optional[str] = None,
+        after: Optional[str] = None,
     ) -> List[RecipeType]:
-        queryset = Recipe.objects.all()
+        queryset = recipe_queryset(info)
         
         if search:
-            queryset = queryset.filter(name__icontains=search)
+            queryset = search_by_name(queryset, search)
+
+        # A recipesPage cursor seeks straight to the next page; page is only
+        # honoured without one
+        if after:
+            return await fetch_rows(after_cursor(queryset, after)[:page_size])
             
-        return list(queryset[((page - 1) * page_size):(page * page_size)])
+        return await fetch_rows(queryset[((page - 1) * page_size):(page * page_size)])
+
+    @strawberry.field
+    async def recipes_page(
+        self,
+        info: Info,
+        cursor: Optional[str] = None,
+        page_size: int = 10,
+        search: Optional[str] = None,
+    ) -> RecipePage:
+        if page_size <= 0:
+            raise ValueError("Page size must be greater than 0.")
+
+        queryset = recipe_queryset(info, "data", always=("created_at",)).order_by(
+            "-created_at", "-id"
+        )
+
+        if search:
+            queryset = search_by_name(queryset, search)
+
+        if cursor:
+            queryset = after_cursor(queryset, cursor)
+
+        data, next_cursor, has_more = await keyset_page(
+            queryset,
+            page_size,
+            lambda recipe: (recipe.created_at.isoformat(), recipe.id),
+        )
+        return RecipePage(data=data, next_cursor=next_cursor, has_more=has_more)
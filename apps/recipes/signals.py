@@ -0,0 +1,16 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_recipe
+from .models import Recipe, RecipeIngredient
+
+
+@receiver([post_save, post_delete], sender=Recipe)
+def invalidate_saved_recipe(sender, instance, **kwargs):
+    invalidate_recipe(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=RecipeIngredient)
+def invalidate_recipe_of_ingredient(sender, instance, **kwargs):
+    # The cached entry includes the ingredient count
+    invalidate_recipe(instance.recipe_id)
@@ -1,3 +1,87 @@
-from django.test import TestCase
+import time
+from datetime import datetime, timezone
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from api.pagination import encode_cursor
+from .cache import (
+    RECIPE_VERSION_TIMEOUT,
+    _bump_version,
+    cache_recipe,
+    get_cached_recipe,
+    recipe_cache_version,
+    recipe_version_key,
+)
+from .models import Recipe
+from .queries import after_cursor
+
+
+class AfterCursorTests(SimpleTestCase):
+    def test_bounds_index_scan_before_tie_break(self):
+        cursor = encode_cursor("2024-11-12T10:15:00+00:00", 7)
+        queryset = after_cursor(Recipe.objects.all(), cursor)
+
+        sql, params = queryset.query.get_compiler("default").as_sql()
+        where = sql.split(" WHERE ", 1)[1]
+        self.assertTrue(
+            where.startswith('("recipes_recipe"."created_at" <= %s AND ('), where
+        )
+        self.assertEqual(params[-1], 7)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class RecipeCacheTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def recipe(self, name, ingredient_count=2):
+        now = datetime(2024, 11, 12, tzinfo=timezone.utc)
+        recipe = Recipe(
+            id=1,
+            name=name,
+            description="",
+            instructions="",
+            cooking_time=10,
+            created_at=now,
+            updated_at=now,
+        )
+        recipe._ingredient_count = ingredient_count
+        return recipe
+
+    async def test_hit_after_cache_recipe(self):
+        version = await recipe_cache_version(1)
+        await cache_recipe(self.recipe("Cake"), version)
+
+        cached = await get_cached_recipe(1, await recipe_cache_version(1))
+        self.assertEqual(cached.name, "Cake")
+        self.assertEqual(cached.ingredient_count, 2)
+
+    async def test_miss_after_bump(self):
+        version = await recipe_cache_version(1)
+        await cache_recipe(self.recipe("Cake"), version)
+        _bump_version(1)
+
+        version = await recipe_cache_version(1)
+        self.assertIsNone(await get_cached_recipe(1, version))
+
+    async def test_stale_row_under_old_version_never_served(self):
+        # A reader takes the version, a write commits, then the reader
+        # caches the row it loaded before the write
+        version = await recipe_cache_version(1)
+        _bump_version(1)
+        await cache_recipe(self.recipe("Stale"), version)
+
+        current = await recipe_cache_version(1)
+        self.assertNotEqual(current, version)
+        self.assertIsNone(await get_cached_recipe(1, current))
+
+    async def test_version_key_expires(self):
+        await recipe_cache_version(1)
+        later = time.time() + RECIPE_VERSION_TIMEOUT + 1
+        with mock.patch("django.core.cache.backends.locmem.time.time") as now:
+            now.return_value = later
+            self.assertIsNone(await cache.aget(recipe_version_key(1)))
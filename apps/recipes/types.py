@@ -1,8 +1,10 @@
-from typing import List
+from typing import List, Optional
 import strawberry
 from strawberry import auto
+from strawberry.types import Info
+from asgiref.sync import sync_to_async
 
-from .models import Recipe, RecipeIngredient
+from .models import Recipe
 from apps.ingredients.types import IngredientType
 
 
@@ -25,9 +27,20 @@ class RecipeType:
     updated_at: auto
     
     @strawberry.field
-    def ingredients(self) -> List[RecipeIngredientType]:
-        return RecipeIngredient.objects.filter(recipe=self)
+    async def ingredients(self, info: Info) -> List[RecipeIngredientType]:
+        # Batched with every other recipe resolved in the same tick
+        return await info.context.recipe_ingredients_loader.load(self.id)
     
     @strawberry.field
-    def ingredient_count(self) -> int:
-        return self.ingredient_count
+    async def ingredient_count(self) -> int:
+        # Annotated by list queries; only the COUNT fallback needs the sync thread
+        if hasattr(self, "_ingredient_count"):
+            return self._ingredient_count
+        return await sync_to_async(getattr)(self, "ingredient_count")
+
+
+@strawberry.type
+class RecipePage:
+    data: List[RecipeType]
+    next_cursor: Optional[str]
+    has_more: bool
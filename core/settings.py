@@ -41,6 +41,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     'rest_framework',
     'rest_framework_simplejwt',
     'rest_framework_simplejwt.token_blacklist',
@@ -110,11 +111,31 @@ DATABASES = {
         "PORT": getenv("PGPORT", 5432),
         "OPTIONS": {
             "sslmode": "require",
+            # Reuse connections across requests; persistent connections
+            # (CONN_MAX_AGE) don't suit ASGI, where each request gets its own thread
+            "pool": True,
         },
     }
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+
+# Shared across workers when Redis is configured. The per-process fallback
+# only suits a single worker: invalidations don't reach other processes
+CACHES = {
+    "default": (
+        {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": getenv("REDIS_URL"),
+        }
+        if getenv("REDIS_URL")
+        else {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    )
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
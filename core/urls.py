@@ -1,11 +1,15 @@
 from django.contrib import admin
 from django.urls import path
-from strawberry.django.views import GraphQLView
+from asgiref.sync import sync_to_async
+from strawberry.django.views import AsyncGraphQLView
 from api.schema import schema
+from api.context import GraphQLContext
+from api.persisted_queries import PersistedQueryViewMixin
 from django.views.decorators.csrf import csrf_exempt
 
 # apps/authentication/views.py
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.exceptions import AuthenticationFailed
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt import views as jwt_views
 from django.core.exceptions import PermissionDenied
@@ -16,30 +20,39 @@ from django.core.exceptions import PermissionDenied
 class AuthenticatedGraphQLViewMixin:
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated]
+    # Django builds a view instance per request, so share one authenticator;
+    # it holds no per-request state
+    jwt_authenticator = JWTAuthentication()
 
-    def __init__(self, jwt_authenticator=None, *args, **kwargs):
-        self.jwt_authenticator = jwt_authenticator or JWTAuthentication()
-        super().__init__(*args, **kwargs)
-
-    def get_context(self, request, response):
+    async def get_context(self, request, response):
         """
         Override get_context to check if user is authenticated
         """
-        try:
-            # Perform authentication here - overriding get context so that graphql queries cant be executed without it
-            auth_result = self.jwt_authenticator.authenticate(request)
+        # Decode and verify the token at most once per HTTP request
+        user = getattr(request, "_jwt_user", None)
+        if user is None:
+            try:
+                # Perform authentication here - overriding get context so that graphql queries cant be executed without it
+                auth_result = await sync_to_async(
+                    self.jwt_authenticator.authenticate
+                )(request)
+            except AuthenticationFailed as e:
+                raise PermissionDenied(f"Authentication required - {str(e)}")
+
             if auth_result is None:
                 raise PermissionDenied("Authentication required")
 
             user, _ = auth_result
-            request.user = user
-            context = super().get_context(request, response)
-            return context
-        except Exception as e:
-            raise PermissionDenied(f"Authentication required - {str(e)}")
+            request._jwt_user = user
+
+        request.user = user
+        # Fresh loaders per request so cached rows never leak across requests
+        return GraphQLContext(request=request, response=response)
 
 
-class AuthenticatedGraphQLView(AuthenticatedGraphQLViewMixin, GraphQLView):
+class AuthenticatedGraphQLView(
+    AuthenticatedGraphQLViewMixin, PersistedQueryViewMixin, AsyncGraphQLView
+):
     pass
 
 